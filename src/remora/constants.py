@@ -20,6 +20,10 @@ ADAM_OPT = "adam"
 ADAMW_OPT = "adamw"
 OPTIMIZERS = (ADAMW_OPT, SGD_OPT, ADAM_OPT)
 
+BF16_PRECISION = "bf16"
+FP16_PRECISION = "fp16"
+MIXED_PRECISIONS = (BF16_PRECISION, FP16_PRECISION)
+
 FINAL_MODEL_FILENAME = "model_final.checkpoint"
 FINAL_TORCHSCRIPT_MODEL_FILENAME = "model_final.pt"
 SAVE_DATASET_FILENAME = "remora_train_data.npz"
@@ -183,7 +183,11 @@ class RemoraRead:
     @property
     def sig(self):
         if self._sig is None:
-            self._sig = (self.dacs - self.shift) / self.scale
+            # store as float32 once so extracted chunks match the dataset
+            # signal tensor dtype without a per-chunk conversion
+            self._sig = ((self.dacs - self.shift) / self.scale).astype(
+                np.float32
+            )
         return self._sig
 
     @property
@@ -191,7 +195,7 @@ class RemoraRead:
         if self._sig_cumsum is None:
             self._sig_cumsum = np.empty(self.sig.size + 1)
             self._sig_cumsum[0] = 0
-            self._sig_cumsum[1:] = np.cumsum(self.sig)
+            self._sig_cumsum[1:] = np.cumsum(self.sig, dtype=np.float64)
         return self._sig_cumsum
 
     @property
@@ -332,14 +336,17 @@ class RemoraRead:
         base_pred=False,
         read_focus_base=-1,
         check_chunk=False,
+        seq_start=None,
+        seq_end=None,
     ):
         chunk_len = sum(chunk_context)
         sig_start = focus_sig_idx - chunk_context[0]
         sig_end = focus_sig_idx + chunk_context[1]
         seq_to_sig_offset = 0
         if sig_start >= 0 and sig_end <= self.sig.size:
-            # chunk boundaries are within read signal
-            chunk_sig = self.sig[sig_start:sig_end].copy()
+            # chunk boundaries are within read signal. Use a view as the
+            # signal is copied when the chunk is added to a dataset
+            chunk_sig = self.sig[sig_start:sig_end]
         else:
             # if signal is not available for full chunk pad with zeros
             chunk_sig = np.zeros(chunk_len, dtype=np.float32)
@@ -355,19 +362,25 @@ class RemoraRead:
                 sig_end = self.sig.size
             chunk_sig[fill_st:fill_en] = self.sig[sig_start:sig_end]
 
-        seq_start = (
-            np.searchsorted(self.seq_to_sig_map, sig_start, side="right") - 1
-        )
-        seq_end = np.searchsorted(self.seq_to_sig_map, sig_end, side="left")
+        # sequence bounds may be computed in bulk by the caller
+        if seq_start is None:
+            seq_start = (
+                np.searchsorted(self.seq_to_sig_map, sig_start, side="right")
+                - 1
+            )
+        if seq_end is None:
+            seq_end = np.searchsorted(self.seq_to_sig_map, sig_end, side="left")
 
-        # extract/compute sequence to signal mapping for this chunk
-        chunk_seq_to_sig = self.seq_to_sig_map[seq_start : seq_end + 1].copy()
+        # extract/compute sequence to signal mapping for this chunk. Cast to
+        # int32 as the copy so the shift below can be applied in place
+        chunk_seq_to_sig = self.seq_to_sig_map[seq_start : seq_end + 1].astype(
+            np.int32
+        )
         # shift mapping relative to the chunk
         chunk_seq_to_sig -= sig_start - seq_to_sig_offset
         # set chunk ends to chunk boundaries
         chunk_seq_to_sig[0] = 0
         chunk_seq_to_sig[-1] = chunk_len
-        chunk_seq_to_sig = chunk_seq_to_sig.astype(np.int32)
 
         # extract context sequence
         kmer_before_bases, kmer_after_bases = kmer_context_bases
@@ -421,20 +434,48 @@ class RemoraRead:
         offset=0,
         check_chunks=False,
     ):
-        for focus_base in self.focus_bases:
-            label = -1 if self.labels is None else self.labels[focus_base]
-            # add offset and ensure not out of bounds
-            focus_base = max(
-                min(focus_base + offset, self.seq_to_sig_map.size - 2), 0
+        read_focus_bases = np.asarray(self.focus_bases, dtype=np.int64)
+        # add offset and ensure not out of bounds
+        chunk_focus_bases = np.clip(
+            read_focus_bases + offset, 0, self.seq_to_sig_map.size - 2
+        )
+        if base_start_justify:
+            focus_sig_idxs = self.seq_to_sig_map[chunk_focus_bases]
+        else:
+            # compute position at center of central base
+            focus_sig_idxs = (
+                self.seq_to_sig_map[chunk_focus_bases]
+                + self.seq_to_sig_map[chunk_focus_bases + 1]
+            ) // 2
+        # find sequence bounds for all chunks with a single search over the
+        # mapping (signal bounds clipped to the read as in extract_chunk)
+        seq_starts = (
+            np.searchsorted(
+                self.seq_to_sig_map,
+                np.maximum(focus_sig_idxs - chunk_context[0], 0),
+                side="right",
             )
-            if base_start_justify:
-                focus_sig_idx = self.seq_to_sig_map[focus_base]
-            else:
-                # compute position at center of central base
-                focus_sig_idx = (
-                    self.seq_to_sig_map[focus_base]
-                    + self.seq_to_sig_map[focus_base + 1]
-                ) // 2
+            - 1
+        )
+        seq_ends = np.searchsorted(
+            self.seq_to_sig_map,
+            np.minimum(focus_sig_idxs + chunk_context[1], self.sig.size),
+            side="left",
+        )
+        for (
+            read_focus_base,
+            focus_base,
+            focus_sig_idx,
+            seq_start,
+            seq_end,
+        ) in zip(
+            read_focus_bases,
+            chunk_focus_bases,
+            focus_sig_idxs,
+            seq_starts,
+            seq_ends,
+        ):
+            label = -1 if self.labels is None else self.labels[read_focus_base]
             try:
                 yield self.extract_chunk(
                     focus_sig_idx,
@@ -444,6 +485,8 @@ class RemoraRead:
                     base_pred=base_pred,
                     read_focus_base=focus_base,
                     check_chunk=check_chunks,
+                    seq_start=seq_start,
+                    seq_end=seq_end,
                 )
             except RemoraError as e:
                 LOGGER.debug(f"FAILED_CHUNK_CHECK {e}")
@@ -482,8 +525,7 @@ class RemoraRead:
             shuffle_on_iter=False,
             drop_last=False,
         )
-        for chunk in chunks:
-            dataset.add_chunk(chunk)
+        dataset.add_chunks(chunks)
         dataset.set_nbatches()
 
         bb, ab = model_metadata["kmer_context_bases"]
@@ -506,17 +548,26 @@ class RemoraRead:
               3. List of positions within the read
         """
         device = next(model.parameters()).device
-        read_outputs, read_poss, read_labels = [], [], []
+        # write each batch directly into arrays covering all read chunks
+        # instead of collecting per-batch arrays and concatenating
+        nchunks = sum(labels.size for _, _, labels, _ in self.batches)
+        read_outputs = None
+        read_labels = np.empty(nchunks, dtype=self.batches[0][2].dtype)
+        read_poss = np.empty(nchunks, dtype=self.batches[0][3].dtype)
+        b_st = 0
         for sigs, enc_kmers, labels, read_pos in self.batches:
             sigs = torch.from_numpy(sigs).to(device)
-            enc_kmers = torch.from_numpy(enc_kmers).to(device)
+            enc_kmers = torch.from_numpy(enc_kmers).to(device).float()
             output = model(sigs, enc_kmers).detach().cpu().numpy()
-            read_outputs.append(output)
-            read_labels.append(labels)
-            read_poss.append(read_pos)
-        read_outputs = np.concatenate(read_outputs, axis=0)
-        read_labels = np.concatenate(read_labels)
-        read_poss = np.concatenate(read_poss)
+            if read_outputs is None:
+                read_outputs = np.empty(
+                    (nchunks, *output.shape[1:]), dtype=output.dtype
+                )
+            b_en = b_st + labels.size
+            read_outputs[b_st:b_en] = output
+            read_labels[b_st:b_en] = labels
+            read_poss[b_st:b_en] = read_pos
+            b_st = b_en
         return read_outputs, read_labels, read_poss
 
 
@@ -738,6 +789,7 @@ class RemoraDataset:
             self.read_focus_bases = None
             gc.collect()
         self._class_ordered_indices = None
+        self._iter_indices = None
 
     def add_chunk(self, chunk):
         if self.nchunks >= self.labels.size:
@@ -758,6 +810,45 @@ class RemoraDataset:
             self.read_focus_bases[self.nchunks] = chunk.read_focus_base
         self.nchunks += 1
 
+    def add_chunks(self, chunks):
+        """Add a list of chunks, copying each attribute for all chunks at
+        once instead of chunk by chunk as in add_chunk.
+        """
+        num_chunks = len(chunks)
+        if num_chunks == 0:
+            return
+        b_st, b_en = self.nchunks, self.nchunks + num_chunks
+        if b_en > self.labels.size:
+            raise RemoraError(
+                "Cannot add chunks to currently allocated tensors"
+            )
+        seq_lens = np.array([chunk.seq_len for chunk in chunks])
+        if seq_lens.max() > self.max_seq_len:
+            raise RemoraError("Chunk sequence too long to store")
+        self.sig_tensor[b_st:b_en, 0] = np.stack(
+            [chunk.signal for chunk in chunks]
+        )
+        # sequence and mapping rows are variable length so fill all rows with
+        # a single scatter of the concatenated values
+        for arr, row_vals in (
+            (self.seq_array, [chunk.seq_w_context for chunk in chunks]),
+            (self.seq_mappings, [chunk.seq_to_sig_map for chunk in chunks]),
+        ):
+            row_lens = np.array([vals.size for vals in row_vals])
+            row_starts = np.cumsum(row_lens) - row_lens
+            arr[
+                np.repeat(np.arange(b_st, b_en), row_lens),
+                np.arange(row_lens.sum()) - np.repeat(row_starts, row_lens),
+            ] = np.concatenate(row_vals)
+        self.seq_lens[b_st:b_en] = seq_lens
+        self.labels[b_st:b_en] = [chunk.label for chunk in chunks]
+        if not self.drop_read_attrs:
+            self.read_ids[b_st:b_en] = [chunk.read_id for chunk in chunks]
+            self.read_focus_bases[b_st:b_en] = [
+                chunk.read_focus_base for chunk in chunks
+            ]
+        self.nchunks += num_chunks
+
     def add_batch(
         self, b_sig, b_seq, b_ss_map, b_seq_lens, b_labels, b_rids, b_rfbs
     ):
@@ -858,8 +949,9 @@ class RemoraDataset:
             "seq_lens",
             "labels",
         ):
+            # arrays are released by reference counting as each attribute is
+            # replaced, so a single collection pass below is sufficient
             setattr(self, attr, getattr(self, attr)[indices])
-            gc.collect()
         if not self.drop_read_attrs:
             self.read_ids = self.read_ids[indices]
             self.read_focus_bases = self.read_focus_bases[indices]
@@ -922,7 +1014,10 @@ class RemoraDataset:
         # order each tensor to batch ordering
         self.reorder_chunks(global_ordered_indices)
 
-    def shuffle_by_batch_labels(self):
+    def get_batch_labels_shuffle_indices(self):
+        """Get indices shuffling chunks within each label while maintaining
+        the batch label proportions set by order_chunks_by_batch_labels.
+        """
         if self._class_ordered_indices is None:
             raise RemoraError(
                 "Must run order_chunks_by_batch_labels before "
@@ -931,7 +1026,10 @@ class RemoraDataset:
         global_ordered_indices = np.empty(self.nchunks, dtype=int)
         for coi in self._class_ordered_indices:
             global_ordered_indices[coi] = np.random.permutation(coi)
-        self.reorder_chunks(global_ordered_indices)
+        return global_ordered_indices
+
+    def shuffle_by_batch_labels(self):
+        self.reorder_chunks(self.get_batch_labels_shuffle_indices())
         self.shuffled = True
 
     def shuffle(self):
@@ -1037,10 +1135,13 @@ class RemoraDataset:
         )
 
     def __iter__(self):
+        # shuffle an index permutation and gather each batch from it instead
+        # of reordering (and copying) every data array on each iteration
+        self._iter_indices = None
         if self.batch_label_props is not None:
-            self.shuffle_by_batch_labels()
+            self._iter_indices = self.get_batch_labels_shuffle_indices()
         elif self.shuffle_on_iter:
-            self.shuffle()
+            self._iter_indices = np.random.permutation(self.nchunks)
         self._batch_i = 0
         return self
 
@@ -1050,18 +1151,22 @@ class RemoraDataset:
         self._batch_i += 1
         b_st = (self._batch_i - 1) * self.batch_size
         b_en = b_st + self.batch_size
+        if self._iter_indices is None:
+            b_idx = slice(b_st, b_en)
+        else:
+            b_idx = self._iter_indices[b_st:b_en]
         read_ids = read_focus_bases = None
         if not self.drop_read_attrs:
-            read_ids = self.read_ids[b_st:b_en]
-            read_focus_bases = self.read_focus_bases[b_st:b_en]
+            read_ids = self.read_ids[b_idx]
+            read_focus_bases = self.read_focus_bases[b_idx]
         return (
             (
-                self.sig_tensor[b_st:b_en],
-                self.seq_array[b_st:b_en],
-                self.seq_mappings[b_st:b_en],
-                self.seq_lens[b_st:b_en],
+                self.sig_tensor[b_idx],
+                self.seq_array[b_idx],
+                self.seq_mappings[b_idx],
+                self.seq_lens[b_idx],
             ),
-            self.labels[b_st:b_en],
+            self.labels[b_idx],
             (
                 read_ids,
                 read_focus_bases,
@@ -1289,7 +1394,10 @@ class RemoraDataset:
     @classmethod
     def load_from_file(cls, filename, *args, **kwargs):
         # use allow_pickle=True to allow None type in read_data
-        data = np.load(filename, allow_pickle=True)
+        # read all members in a single pass over the archive since each
+        # NpzFile item access re-reads the member from disk
+        with np.load(filename, allow_pickle=True) as npz_data:
+            data = dict(npz_data)
         try:
             version = int(data["version"].item())
         except KeyError:
@@ -1488,9 +1596,7 @@ def merge_datasets(input_datasets, balance=False, quiet=False):
             shuffle_on_iter=False,
             drop_last=False,
         )
-        if num_chunks is not None and num_chunks < dataset.nchunks:
-            dataset.shuffle()
-        else:
+        if num_chunks is None or num_chunks > dataset.nchunks:
             num_chunks = dataset.nchunks
         return dataset, num_chunks
 
@@ -1588,32 +1694,25 @@ def merge_datasets(input_datasets, balance=False, quiet=False):
                 label_conv[input_lab + 1] = (
                     output_dataset.mod_bases.find(mod_base) + 1
                 )
-        added_chunks = 0
-        for (
-            (b_sig, b_seq, b_ss_map, b_seq_lens),
-            b_labels,
-            (b_rids, b_rfbs),
-        ) in input_dataset:
-            b_labels = label_conv[b_labels]
-            if added_chunks + b_labels.size >= num_chunks:
-                batch_size = num_chunks - added_chunks
-                output_dataset.add_batch(
-                    b_sig[:batch_size],
-                    b_seq[:batch_size],
-                    b_ss_map[:batch_size],
-                    b_seq_lens[:batch_size],
-                    b_labels[:batch_size],
-                    b_rids[:batch_size],
-                    b_rfbs[:batch_size],
-                )
-                added_chunks += batch_size
-                break
-            added_chunks += b_labels.size
-            output_dataset.add_batch(
-                b_sig, b_seq, b_ss_map, b_seq_lens, b_labels, b_rids, b_rfbs
+        # select a random subset of chunk indices instead of shuffling every
+        # input array and copying batch by batch
+        if num_chunks < input_dataset.nchunks:
+            indices = np.random.choice(
+                input_dataset.nchunks, num_chunks, replace=False
             )
+        else:
+            indices = slice(None, num_chunks)
+        output_dataset.add_batch(
+            input_dataset.sig_tensor[indices],
+            input_dataset.seq_array[indices],
+            input_dataset.seq_mappings[indices],
+            input_dataset.seq_lens[indices],
+            label_conv[input_dataset.labels[indices]],
+            input_dataset.read_ids[indices],
+            input_dataset.read_focus_bases[indices],
+        )
         log_fp(
-            f"Copied {added_chunks} chunks. New label distribution: "
+            f"Copied {num_chunks} chunks. New label distribution: "
             f"{output_dataset.get_label_counts()}"
         )
         del input_dataset
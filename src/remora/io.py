@@ -1712,7 +1712,6 @@ class Read:
             raise RemoraError("missing alignment")
 
         basecall_int_seq = util.seq_to_int(self.seq)
-        reference_int_seq = util.seq_to_int(self.ref_seq)
 
         all_base_call_focus_positions = util.find_focus_bases_in_int_sequence(
             int_seq=basecall_int_seq, motifs=motifs
@@ -1722,7 +1721,9 @@ class Read:
         mapping = DC.make_sequence_coordinate_mapping(self.cigar).astype(int)
 
         reference_motif_positions = (
-            util.find_focus_bases_in_int_sequence(reference_int_seq, motifs)
+            util.find_focus_bases_in_int_sequence(
+                util.seq_to_int(self.ref_seq), motifs
+            )
             if select_focus_reference_positions is None
             else self.get_filtered_focus_positions(
                 select_focus_positions=select_focus_reference_positions,
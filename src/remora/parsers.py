@@ -636,6 +636,33 @@ def register_model_train(parser):
         type=int,
         help="Number of layers to be frozen for finetuning.",
     )
+    train_grp.add_argument(
+        "--mixed-precision",
+        choices=constants.MIXED_PRECISIONS,
+        help="""Run the model forward pass in mixed precision. fp16 requires
+        a CUDA device and enables loss scaling. Validation is always
+        computed in full precision.""",
+    )
+    train_grp.add_argument(
+        "--compile-model",
+        action="store_true",
+        help="""Compile the model with torch.compile for training steps.
+        Requires PyTorch>=2.0.""",
+    )
+    train_grp.add_argument(
+        "--skip-initial-validation",
+        action="store_true",
+        help="""Skip the validation pass over the held-out and training
+        validation sets before the first epoch.""",
+    )
+    train_grp.add_argument(
+        "--accum-steps",
+        default=1,
+        type=int,
+        help="""Number of batches over which to accumulate gradients before
+        each optimizer step. The effective batch size is --batch-size
+        multiplied by this value.""",
+    )
 
     comp_grp = subparser.add_argument_group("Compute Arguments")
     comp_grp.add_argument(
@@ -687,6 +714,10 @@ def run_model_train(args):
         args.high_conf_incorrect_thr_frac,
         args.finetune_path,
         args.freeze_num_layers,
+        args.mixed_precision,
+        args.compile_model,
+        args.skip_initial_validation,
+        args.accum_steps,
     )
 
 
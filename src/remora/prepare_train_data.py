@@ -49,7 +49,9 @@ def extract_chunks(
                 motifs=motifs,
                 select_focus_reference_positions=focus_ref_pos,
             )
-            remora_read.labels = np.full(len(io_read.seq), int_label, dtype=int)
+            remora_read.labels = np.full(
+                len(io_read.seq), int_label, dtype=np.int8
+            )
         else:
             io_read.ref_to_signal = compute_ref_to_signal(
                 io_read.query_to_signal,
@@ -69,7 +71,7 @@ def extract_chunks(
                 scale=io_read.scale_dacs_to_norm,
                 seq_to_sig_map=shift_ref_to_sig,
                 str_seq=io_read.ref_seq,
-                labels=np.full(len(io_read.ref_seq), int_label, dtype=int),
+                labels=np.full(len(io_read.ref_seq), int_label, dtype=np.int8),
                 read_id=io_read.read_id,
             )
             if focus_ref_pos is not None:
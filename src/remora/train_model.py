@@ -1,5 +1,6 @@
 import os
 import atexit
+import inspect
 from shutil import copyfile
 
 import torch
@@ -21,9 +22,35 @@ from remora import (
 LOGGER = log.get_logger()
 BREACH_THRESHOLD = 0.8
 REGRESSION_THRESHOLD = 0.7
+# number of training batches between writes to the batch log
+BATCH_LOG_INTERVAL = 100
+
+
+def get_fused_kwargs(opt_class, model):
+    """Keyword arguments selecting the fused CUDA update kernels for an
+    optimizer, or an empty dict if unavailable.
+
+    Args:
+        opt_class (type): torch.optim optimizer class
+        model (torch.nn.Module): Model to be optimized
+    """
+    # fused updates require parameters on a CUDA device and are not
+    # available for all optimizers in older versions of PyTorch
+    if not next(model.parameters()).is_cuda:
+        return {}
+    if "fused" not in inspect.signature(opt_class).parameters:
+        LOGGER.debug(
+            f"{opt_class.__name__} fused updates not available in this "
+            "version of PyTorch"
+        )
+        return {}
+    return {"fused": True}
 
 
 def load_optimizer(optimizer, model, lr, weight_decay, momentum=0.9):
+    # use the fused CUDA Adam/AdamW update kernels when available instead of
+    # looping over each parameter. SGD already uses the multi-tensor
+    # (foreach) update by default on CUDA
     if optimizer == constants.SGD_OPT:
         return torch.optim.SGD(
             model.parameters(),
@@ -37,12 +64,14 @@ def load_optimizer(optimizer, model, lr, weight_decay, momentum=0.9):
             model.parameters(),
             lr=lr,
             weight_decay=weight_decay,
+            **get_fused_kwargs(torch.optim.Adam, model),
         )
     elif optimizer == constants.ADAMW_OPT:
         return torch.optim.AdamW(
             model.parameters(),
             lr=lr,
             weight_decay=weight_decay,
+            **get_fused_kwargs(torch.optim.AdamW, model),
         )
     raise RemoraError(f"Invalid optimizer specified ({optimizer})")
 
@@ -88,6 +117,58 @@ def save_model(
         )
 
 
+def write_batch_losses(batch_fp, start_iter, batch_losses, num_filt=None):
+    """Write batch losses to the batch log
+
+    Args:
+        batch_fp (file): Batch log file handle
+        start_iter (int): Iteration number of the first batch
+        batch_losses (list): Batch loss tensors (possibly on device)
+        num_filt (list): Number of filtered chunks from each batch
+    """
+    if len(batch_losses) == 0:
+        return
+    batch_losses = torch.stack(batch_losses).cpu().numpy()
+    for batch_i, batch_loss in enumerate(batch_losses):
+        batch_fp.write(f"{start_iter + batch_i}\t{batch_loss:.6f}")
+        if num_filt is None:
+            batch_fp.write("\n")
+        else:
+            batch_fp.write(f"\t{num_filt[batch_i]}\n")
+
+
+def iter_encoded_batches(dataset, pin_device=None):
+    """Iterate over dataset batches with encoded k-mers as torch tensors
+
+    Args:
+        dataset (RemoraDataset): Dataset to iterate over
+        pin_device (torch.device): CUDA device to copy batches to. If set,
+            tensors are copied into page-locked memory to allow asynchronous
+            copies to this device
+
+    Yields:
+        3-tuple of signal, encoded k-mer and label tensors
+    """
+    bb, ab = dataset.kmer_context_bases
+    if pin_device is not None:
+        # the current CUDA device is per thread. Set it so pinned memory is
+        # not allocated via a new context on the default device when this
+        # generator is consumed from a background thread
+        torch.cuda.set_device(pin_device)
+    for (sigs, seqs, seq_maps, seq_lens), labels, _ in dataset:
+        enc_kmers = encoded_kmers.compute_encoded_kmer_batch(
+            bb, ab, seqs, seq_maps, seq_lens
+        )
+        batch = (
+            torch.from_numpy(sigs),
+            torch.from_numpy(enc_kmers),
+            torch.from_numpy(labels),
+        )
+        if pin_device is not None:
+            batch = tuple(tensor.pin_memory() for tensor in batch)
+        yield batch
+
+
 def train_model(
     seed,
     device,
@@ -115,6 +196,10 @@ def train_model(
     high_conf_incorrect_thr_frac,
     finetune_path,
     freeze_num_layers,
+    mixed_precision=None,
+    compile_model=False,
+    skip_initial_validation=False,
+    accum_steps=1,
 ):
     seed = (
         np.random.randint(0, np.iinfo(np.uint32).max, dtype=np.uint32)
@@ -128,6 +213,11 @@ def train_model(
     if device is not None and device.type == "cuda":
         torch.cuda.manual_seed_all(seed)
         torch.cuda.set_device(device)
+        # chunk shapes are fixed by the chunk context, so let cuDNN select the
+        # fastest kernels and allow TF32 tensor cores on supported devices
+        torch.backends.cudnn.benchmark = True
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
 
     LOGGER.info("Loading dataset from Remora file")
     dataset = RemoraDataset.load_from_file(
@@ -242,9 +332,49 @@ def train_model(
     criterion = torch.nn.CrossEntropyLoss()
     model = model.to(device)
     criterion = criterion.to(device)
+    # pinned host batches allow host to device copies to run asynchronously
+    non_blocking = device is not None and device.type == "cuda"
     opt = load_optimizer(optimizer, model, lr, weight_decay)
 
     scheduler = select_scheduler(scheduler_name, opt, lr_sched_kwargs)
+    autocast_kwargs = {
+        "device_type": "cpu" if device is None else device.type,
+        "enabled": mixed_precision is not None,
+    }
+    if mixed_precision is not None:
+        autocast_kwargs["dtype"] = (
+            torch.float16
+            if mixed_precision == constants.FP16_PRECISION
+            else torch.bfloat16
+        )
+        LOGGER.info(f"Training with {mixed_precision} mixed precision")
+    if mixed_precision == constants.FP16_PRECISION and (
+        device is None or device.type != "cuda"
+    ):
+        raise RemoraError("fp16 mixed precision requires a CUDA device")
+    if accum_steps < 1:
+        raise RemoraError("Gradient accumulation steps must be at least 1")
+    # float16 gradients may underflow so scale the loss. bfloat16 shares the
+    # float32 exponent range so no loss scaling is needed
+    use_scaler = mixed_precision == constants.FP16_PRECISION
+    if hasattr(torch.amp, "GradScaler"):
+        scaler = torch.amp.GradScaler("cuda", enabled=use_scaler)
+    else:
+        # torch.cuda.amp.GradScaler is deprecated from PyTorch 2.4
+        scaler = torch.cuda.amp.GradScaler(enabled=use_scaler)
+    # compiled module is only used for training steps. Validation and
+    # checkpointing use the original module (compiled state_dict keys are
+    # prefixed and validation batch sizes vary)
+    train_module = model
+    if compile_model:
+        if hasattr(torch, "compile"):
+            LOGGER.info("Compiling model for training")
+            train_module = torch.compile(model)
+        else:
+            LOGGER.warning(
+                "torch.compile not available in this version of PyTorch. "
+                "Training uncompiled model."
+            )
 
     label_counts = dataset.get_label_counts()
     LOGGER.info(f"Label distribution: {label_counts}")
@@ -274,31 +404,34 @@ def train_model(
         f"{val_trn_ds.get_label_counts()}"
     )
 
-    LOGGER.info("Running initial validation")
-    # assess accuracy before first iteration
-    val_metrics = val_fp.validate_model(
-        model, dataset.mod_bases, criterion, val_ds, filt_frac
-    )
-    trn_metrics = val_fp.validate_model(
-        model,
-        dataset.mod_bases,
-        criterion,
-        val_trn_ds,
-        filt_frac,
-        "trn",
-    )
-
     if ext_val:
         best_alt_val_accs = dict((e_name, 0) for e_name, _ in ext_sets)
-        for e_name, e_set in ext_sets:
-            val_fp.validate_model(
-                model,
-                dataset.mod_bases,
-                criterion,
-                e_set,
-                filt_frac,
-                e_name,
-            )
+    if skip_initial_validation:
+        LOGGER.info("Skipping initial validation")
+    else:
+        LOGGER.info("Running initial validation")
+        # assess accuracy before first iteration
+        val_metrics = val_fp.validate_model(
+            model, dataset.mod_bases, criterion, val_ds, filt_frac
+        )
+        trn_metrics = val_fp.validate_model(
+            model,
+            dataset.mod_bases,
+            criterion,
+            val_trn_ds,
+            filt_frac,
+            "trn",
+        )
+        if ext_val:
+            for e_name, e_set in ext_sets:
+                val_fp.validate_model(
+                    model,
+                    dataset.mod_bases,
+                    criterion,
+                    e_set,
+                    filt_frac,
+                    e_name,
+                )
 
     LOGGER.info("Start training")
     ebar = tqdm(
@@ -313,18 +446,20 @@ def train_model(
     pbar = tqdm(
         total=len(trn_ds),
         desc="Epoch Progress",
+        mininterval=0.5,
         dynamic_ncols=True,
         position=1,
         leave=True,
         bar_format="{desc}: {percentage:3.0f}%|{bar}| " "{n_fmt}/{total_fmt}",
         disable=os.environ.get("LOG_SAFE", False),
     )
-    ebar.set_postfix(
-        acc_val=f"{val_metrics.acc:.4f}",
-        acc_train=f"{trn_metrics.acc:.4f}",
-        loss_val=f"{val_metrics.loss:.6f}",
-        loss_train=f"{trn_metrics.loss:.6f}",
-    )
+    if not skip_initial_validation:
+        ebar.set_postfix(
+            acc_val=f"{val_metrics.acc:.4f}",
+            acc_train=f"{trn_metrics.acc:.4f}",
+            loss_val=f"{val_metrics.loss:.6f}",
+            loss_train=f"{trn_metrics.loss:.6f}",
+        )
     atexit.register(pbar.close)
     atexit.register(ebar.close)
 
@@ -348,30 +483,40 @@ def train_model(
         "model_version": constants.MODEL_VERSION,
         **dataset.sig_map_refiner.get_save_kwargs(),
     }
-    bb, ab = dataset.kmer_context_bases
     best_val_acc = 0
     early_stop_epochs = 0
+    num_trn_batches = len(trn_ds)
+    log_num_filt = high_conf_incorrect_thr_frac is not None
     breached = False
     for epoch in range(epochs):
         model.train()
-        pbar.n = 0
-        pbar.refresh()
-        for epoch_i, ((sigs, seqs, seq_maps, seq_lens), labels, _) in enumerate(
-            trn_ds
-        ):
-            sigs = torch.from_numpy(sigs)
-            enc_kmers = torch.from_numpy(
-                encoded_kmers.compute_encoded_kmer_batch(
-                    bb, ab, seqs, seq_maps, seq_lens
-                )
+        pbar.reset()
+        # keep batch losses on device and log every BATCH_LOG_INTERVAL batches
+        # to avoid forcing a device sync on every training step
+        batch_losses, batch_num_filt = [], []
+        log_start_iter = epoch * num_trn_batches
+        num_epoch_batches = 0
+        # release gradients instead of zero filling them. Gradients are then
+        # accumulated over accum_steps batches before each optimizer step
+        opt.zero_grad(set_to_none=True)
+        # encode (and pin) the next batches in a background thread while the
+        # model runs on the current batch
+        for epoch_i, (sigs, enc_kmers, labels) in enumerate(
+            util.prefetch_iter(
+                iter_encoded_batches(
+                    trn_ds, pin_device=device if non_blocking else None
+                ),
+                name="TrainBatch",
             )
-            labels = torch.from_numpy(labels)
-            sigs = sigs.to(device)
-            enc_kmers = enc_kmers.to(device)
-            outputs = model(sigs, enc_kmers)
+        ):
+            sigs = sigs.to(device, non_blocking=non_blocking)
+            enc_kmers = enc_kmers.to(device, non_blocking=non_blocking).float()
+            with torch.autocast(**autocast_kwargs):
+                outputs = train_module(sigs, enc_kmers)
+            outputs = outputs.float()
 
             if high_conf_incorrect_thr_frac is None:
-                labels = labels.to(device)
+                labels = labels.to(device, non_blocking=non_blocking)
                 loss = criterion(outputs, labels)
             else:
                 batch_size = outputs.shape[0]
@@ -391,25 +536,49 @@ def train_model(
                     conf_thresh = max(conf_thresh, mm_preds[max_nr_skip])
                 mask = cl_match.logical_or(highest_preds < conf_thresh)
                 # avoid sending labels to device until after above computations
-                labels = labels.to(device)
+                labels = labels.to(device, non_blocking=non_blocking)
                 loss = criterion(outputs[mask], labels[mask])
 
-            opt.zero_grad()
-            loss.backward()
-            opt.step()
-            batch_fp.write(
-                f"{(epoch * len(trn_ds)) + epoch_i}\t"
-                f"{loss.detach().cpu():.6f}"
-            )
-            if high_conf_incorrect_thr_frac is None:
-                batch_fp.write("\n")
-            else:
-                batch_fp.write(f"\t{batch_size - mask.sum()}\n")
+            scaler.scale(loss / accum_steps).backward()
+            if (epoch_i + 1) % accum_steps == 0:
+                scaler.step(opt)
+                scaler.update()
+                opt.zero_grad(set_to_none=True)
+            num_epoch_batches += 1
+            batch_losses.append(loss.detach())
+            if log_num_filt:
+                batch_num_filt.append(int(batch_size - mask.sum()))
+            if len(batch_losses) >= BATCH_LOG_INTERVAL:
+                write_batch_losses(
+                    batch_fp,
+                    log_start_iter,
+                    batch_losses,
+                    batch_num_filt if log_num_filt else None,
+                )
+                log_start_iter += len(batch_losses)
+                batch_losses, batch_num_filt = [], []
 
             pbar.update()
-            pbar.refresh()
+        # flush gradients from a final partial accumulation. Losses were
+        # scaled by 1 / accum_steps, so rescale gradients to the mean over
+        # the batches actually accumulated
+        num_accum = num_epoch_batches % accum_steps
+        if num_accum != 0:
+            for param in model.parameters():
+                if param.grad is not None:
+                    param.grad.mul_(accum_steps / num_accum)
+            scaler.step(opt)
+            scaler.update()
+            opt.zero_grad(set_to_none=True)
+
+        write_batch_losses(
+            batch_fp,
+            log_start_iter,
+            batch_losses,
+            batch_num_filt if log_num_filt else None,
+        )
 
-        niter = (epoch + 1) * len(trn_ds)
+        niter = (epoch + 1) * num_trn_batches
         val_metrics = val_fp.validate_model(
             model,
             dataset.mod_bases,
@@ -126,7 +126,7 @@ def seq_to_int(seq):
         np.array containing integer encoded sequence
     """
     return SEQ_TO_INT_ARR[
-        np.array(list(seq), dtype="c").view(np.uint8) - SEQ_MIN
+        np.frombuffer(seq.encode("ascii"), dtype=np.uint8) - SEQ_MIN
     ]
 
 
@@ -143,7 +143,9 @@ def int_to_seq(np_seq, alphabet=CONV_ALPHABET):
         return ""
     if np_seq.max() >= len(alphabet):
         raise RemoraError(f"Invalid value in int sequence ({np_seq.max()})")
-    return "".join(alphabet[b] for b in np_seq)
+    # gather from a byte lookup table instead of joining per-base in python
+    alphabet_lut = np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)
+    return alphabet_lut[np.asarray(np_seq, dtype=np.intp)].tobytes().decode()
 
 
 def resolve_path(fn_path):
@@ -562,5 +564,42 @@ class BackgroundIter:
             pass
 
 
+def _prefetch_filler(iterable, out_q):
+    try:
+        for item in iterable:
+            _put_item((item, None), out_q)
+    except Exception as e:
+        _put_item((None, e), out_q)
+        return
+    _put_item((StopIteration, None), out_q)
+
+
+def prefetch_iter(iterable, num_prefetch=2, name="Prefetch"):
+    """Iterate over iterable in a background thread keeping up to
+    num_prefetch items ready. Items are passed through a thread queue so
+    they are not copied. Exceptions raised by the iterable are re-raised in
+    the consuming thread.
+
+    Args:
+        iterable: Iterable to consume in the background
+        num_prefetch (int): Maximum number of items to prepare ahead
+        name (str): Name for the background thread
+    """
+    out_q = queue.Queue(num_prefetch)
+    Thread(
+        target=_prefetch_filler,
+        args=(iterable, out_q),
+        name=f"{name}_filler",
+        daemon=True,
+    ).start()
+    while True:
+        item, err = _get_item(out_q)
+        if err is not None:
+            raise err
+        if item is StopIteration:
+            return
+        yield item
+
+
 if __name__ == "__main__":
     RuntimeError("This is a module.")
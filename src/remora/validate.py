@@ -6,7 +6,6 @@ from collections import defaultdict, namedtuple
 import torch
 import pysam
 import numpy as np
-import pandas as pd
 from torch import nn
 from tqdm import tqdm
 from sklearn.metrics import confusion_matrix
@@ -98,6 +97,7 @@ def add_unmodeled_labels(output, unmodeled_labels):
     return new_output
 
 
+@torch.inference_mode()
 def _validate_model(
     model,
     model_mod_bases,
@@ -118,12 +118,18 @@ def _validate_model(
     is_torch_model = isinstance(model, nn.Module)
     if is_torch_model:
         model.eval()
-        torch.set_grad_enabled(False)
 
     bb, ab = dataset.kmer_context_bases
     all_labels = []
     all_outputs = []
     all_loss = []
+    # when outputs are not needed on host per batch keep outputs and losses on
+    # device and copy them back once after the final batch
+    keep_on_device = (
+        is_torch_model
+        and unmodeled_labels.size == 0
+        and full_results_fh is None
+    )
 
     if os.environ.get("LOG_SAFE", False):
         disable_pbar = True
@@ -141,28 +147,38 @@ def _validate_model(
         enc_kmers = encoded_kmers.compute_encoded_kmer_batch(
             bb, ab, seqs, seq_maps, seq_lens
         )
+        loss = None
         if is_torch_model:
             sigs = torch.from_numpy(sigs).to(device)
-            enc_kmers = torch.from_numpy(enc_kmers).to(device)
-            output = model(sigs, enc_kmers).detach().cpu().numpy()
+            enc_kmers = torch.from_numpy(enc_kmers).to(device).float()
+            output = model(sigs, enc_kmers).detach()
+            if unmodeled_labels.size == 0:
+                # compute loss on device directly from the model output
+                loss = criterion(output, torch.from_numpy(labels).to(device))
+            if keep_on_device:
+                all_outputs.append(output)
+                all_loss.append(loss)
+                continue
+            output = output.cpu().numpy()
         else:
-            output = model.run([], {"sig": sigs, "seq": enc_kmers})[0]
+            output = model.run(
+                [], {"sig": sigs, "seq": enc_kmers.astype(np.float32)}
+            )[0]
         output = add_unmodeled_labels(output, unmodeled_labels)
+        if loss is None:
+            loss = criterion(torch.from_numpy(output), torch.from_numpy(labels))
         all_outputs.append(output)
-        all_loss.append(
-            criterion(torch.from_numpy(output), torch.from_numpy(labels))
-            .detach()
-            .cpu()
-            .numpy()
-        )
+        all_loss.append(loss)
         if full_results_fh is not None:
             full_results_fh.write_results(
                 output, labels, read_ids, read_focus_bases
             )
-    all_outputs = np.concatenate(all_outputs, axis=0)
+    if keep_on_device:
+        all_outputs = torch.cat(all_outputs).cpu().numpy()
+    else:
+        all_outputs = np.concatenate(all_outputs, axis=0)
+    all_loss = torch.stack(all_loss).cpu().numpy()
     all_labels = np.concatenate(all_labels)
-    if is_torch_model:
-        torch.set_grad_enabled(True)
     all_probs = softmax_axis1(all_outputs)
     (
         acc,
@@ -236,32 +252,36 @@ def process_mods_probs(probs, labels, allow_unbalanced, pct_filt, name):
 
 
 class ResultsWriter:
+    HEADER = (
+        "read_id",
+        "read_focus_base",
+        "label",
+        "class_pred",
+        "class_probs",
+    )
+
     def __init__(self, out_fh):
         self.sep = "\t"
         self.out_fh = out_fh
-        df = pd.DataFrame(
-            columns=[
-                "read_id",
-                "read_focus_base",
-                "label",
-                "class_pred",
-                "class_probs",
-            ]
-        )
-        df.to_csv(self.out_fh, sep=self.sep, index=False)
+        self.out_fh.write(self.sep.join(self.HEADER) + "\n")
 
     def write_results(self, output, labels, read_ids, read_focus_bases):
         class_preds = output.argmax(axis=1)
         str_probs = [",".join(map(str, r)) for r in softmax_axis1(output)]
-        pd.DataFrame(
-            {
-                "read_id": read_ids,
-                "read_focus_base": read_focus_bases,
-                "label": labels,
-                "class_pred": class_preds,
-                "class_probs": str_probs,
-            }
-        ).to_csv(self.out_fh, header=False, index=False, sep=self.sep)
+        # format rows directly and write each batch with a single call
+        # instead of building and serializing a DataFrame per batch
+        self.out_fh.write(
+            "".join(
+                self.sep.join(map(str, row)) + "\n"
+                for row in zip(
+                    read_ids,
+                    read_focus_bases,
+                    labels,
+                    class_preds,
+                    str_probs,
+                )
+            )
+        )
 
 
 class ValidationLogger:
@@ -0,0 +1,201 @@
+""" Test data_chunks module.
+"""
+import numpy as np
+import pytest
+
+from remora import RemoraError
+from remora.data_chunks import RemoraDataset, RemoraRead, merge_datasets
+
+CHUNK_CONTEXT = (50, 50)
+KMER_CONTEXT_BASES = (2, 2)
+
+
+def make_read(nbases, seed=0):
+    """Read with random signal, sequence and dwells (1-15 samples per base)
+    focused on bases at both read edges and the read center.
+    """
+    rng = np.random.default_rng(seed)
+    seq_to_sig_map = np.zeros(nbases + 1, dtype=np.int64)
+    seq_to_sig_map[1:] = np.cumsum(rng.integers(1, 16, nbases))
+    return RemoraRead(
+        dacs=rng.normal(100, 10, seq_to_sig_map[-1]),
+        shift=100.0,
+        scale=10.0,
+        seq_to_sig_map=seq_to_sig_map,
+        int_seq=rng.integers(0, 4, nbases).astype(np.int8),
+        read_id="test_read",
+        labels=rng.integers(0, 2, nbases),
+        focus_bases=np.unique(
+            np.clip(
+                [0, 1, 2, nbases // 2, nbases - 3, nbases - 2, nbases - 1],
+                0,
+                nbases - 1,
+            )
+        ),
+    )
+
+
+def assert_chunks_equal(chunk, exp_chunk):
+    np.testing.assert_array_equal(chunk.signal, exp_chunk.signal)
+    np.testing.assert_array_equal(chunk.seq_w_context, exp_chunk.seq_w_context)
+    np.testing.assert_array_equal(
+        chunk.seq_to_sig_map, exp_chunk.seq_to_sig_map
+    )
+    assert chunk.chunk_sig_focus_idx == exp_chunk.chunk_sig_focus_idx
+    assert chunk.chunk_focus_base == exp_chunk.chunk_focus_base
+    assert chunk.read_focus_base == exp_chunk.read_focus_base
+    assert chunk.label == exp_chunk.label
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("nbases", [5, 60])
+@pytest.mark.parametrize("offset", [-3, 0, 3])
+@pytest.mark.parametrize("base_start_justify", [False, True])
+def test_iter_chunks_seq_bounds(nbases, offset, base_start_justify):
+    """Chunks from iter_chunks, with sequence bounds computed for all chunks
+    at once, match chunks extracted one at a time with per-chunk bounds,
+    including chunks padded past either end of the read.
+    """
+    read = make_read(nbases)
+    chunks = list(
+        read.iter_chunks(
+            CHUNK_CONTEXT,
+            KMER_CONTEXT_BASES,
+            base_start_justify=base_start_justify,
+            offset=offset,
+            check_chunks=True,
+        )
+    )
+    assert len(chunks) == read.focus_bases.size
+    for chunk, read_focus_base in zip(chunks, read.focus_bases):
+        focus_base = min(
+            max(read_focus_base + offset, 0), read.seq_to_sig_map.size - 2
+        )
+        focus_sig_idx = read.seq_to_sig_map[focus_base]
+        if not base_start_justify:
+            focus_sig_idx = (
+                focus_sig_idx + read.seq_to_sig_map[focus_base + 1]
+            ) // 2
+        exp_chunk = read.extract_chunk(
+            focus_sig_idx,
+            CHUNK_CONTEXT,
+            KMER_CONTEXT_BASES,
+            label=read.labels[read_focus_base],
+            read_focus_base=focus_base,
+            check_chunk=True,
+        )
+        assert_chunks_equal(chunk, exp_chunk)
+
+
+def allocate_dataset(num_chunks, max_seq_len):
+    return RemoraDataset.allocate_empty_chunks(
+        num_chunks,
+        CHUNK_CONTEXT,
+        KMER_CONTEXT_BASES,
+        max_seq_len=max_seq_len,
+        mod_bases="",
+        mod_long_names=[],
+    )
+
+
+@pytest.mark.unit
+def test_add_chunks():
+    """Adding chunks in bulk fills the same values as adding each chunk with
+    add_chunk, including variable length sequences and appending to a
+    dataset which already holds chunks.
+    """
+    chunks = [
+        chunk
+        for seed, nbases in enumerate((5, 60, 60, 20))
+        for chunk in make_read(nbases, seed).iter_chunks(
+            CHUNK_CONTEXT, KMER_CONTEXT_BASES
+        )
+    ]
+    max_seq_len = max(chunk.seq_len for chunk in chunks)
+    exp_dataset = allocate_dataset(len(chunks), max_seq_len)
+    for chunk in chunks:
+        exp_dataset.add_chunk(chunk)
+    dataset = allocate_dataset(len(chunks), max_seq_len)
+    dataset.add_chunks(chunks[:3])
+    dataset.add_chunks([])
+    dataset.add_chunks(chunks[3:])
+
+    assert dataset.nchunks == exp_dataset.nchunks == len(chunks)
+    for arr_name in (
+        "sig_tensor",
+        "seq_lens",
+        "labels",
+        "read_ids",
+        "read_focus_bases",
+    ):
+        np.testing.assert_array_equal(
+            getattr(dataset, arr_name), getattr(exp_dataset, arr_name)
+        )
+    # only values up to each sequence length are set
+    for chunk_idx, seq_len in enumerate(exp_dataset.seq_lens):
+        seq_w_context_len = seq_len + sum(KMER_CONTEXT_BASES)
+        np.testing.assert_array_equal(
+            dataset.seq_array[chunk_idx, :seq_w_context_len],
+            exp_dataset.seq_array[chunk_idx, :seq_w_context_len],
+        )
+        np.testing.assert_array_equal(
+            dataset.seq_mappings[chunk_idx, : seq_len + 1],
+            exp_dataset.seq_mappings[chunk_idx, : seq_len + 1],
+        )
+
+    with pytest.raises(RemoraError):
+        dataset.add_chunks(chunks[:1])
+    with pytest.raises(RemoraError):
+        allocate_dataset(len(chunks), max_seq_len - 1).add_chunks(chunks)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("num_chunks", [50, 205, 1000, None])
+def test_merge_datasets_num_chunks(can_chunks, mod_chunks, num_chunks):
+    """Merging keeps all chunks of an input when num_chunks is at least the
+    input size and otherwise a subset of num_chunks distinct chunks.
+    """
+    out_dataset = merge_datasets(
+        [(str(can_chunks), num_chunks), (str(mod_chunks), num_chunks)],
+        quiet=True,
+    )
+    out_st = 0
+    exp_label_counts = {}
+    for in_path, label in ((can_chunks, 0), (mod_chunks, 1)):
+        in_dataset = RemoraDataset.load_from_file(str(in_path))
+        in_num_chunks = in_dataset.nchunks
+        if num_chunks is not None:
+            in_num_chunks = min(num_chunks, in_dataset.nchunks)
+        out_en = out_st + in_num_chunks
+        exp_label_counts[label] = in_num_chunks
+        if in_num_chunks == in_dataset.nchunks:
+            # all chunks are copied in order
+            in_indices = np.arange(in_dataset.nchunks)
+        else:
+            # match output chunks to input chunks by signal
+            sig_to_idx = dict(
+                (sig.tobytes(), idx)
+                for idx, sig in enumerate(in_dataset.sig_tensor)
+            )
+            in_indices = np.array(
+                [
+                    sig_to_idx[sig.tobytes()]
+                    for sig in out_dataset.sig_tensor[out_st:out_en]
+                ]
+            )
+            assert np.unique(in_indices).size == in_num_chunks
+        for arr_name in (
+            "sig_tensor",
+            "seq_array",
+            "seq_mappings",
+            "seq_lens",
+            "read_ids",
+            "read_focus_bases",
+        ):
+            np.testing.assert_array_equal(
+                getattr(out_dataset, arr_name)[out_st:out_en],
+                getattr(in_dataset, arr_name)[in_indices],
+            )
+        out_st = out_en
+    assert out_dataset.nchunks == out_st
+    assert dict(out_dataset.get_label_counts()) == exp_label_counts
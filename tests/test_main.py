@@ -5,6 +5,7 @@ from subprocess import check_call
 
 import pysam
 import pytest
+import torch
 
 from remora.data_chunks import RemoraDataset
 
@@ -28,6 +29,19 @@ EXPECTED_CAN_CHUNKS = 205
 EXPECTED_MOD_CHUNKS = 210
 
 
+def check_train_outputs(out_dir, num_epochs):
+    """Check that final model and batch log outputs were written by
+    `model train` with one batch log row for each training iteration.
+    """
+    assert (out_dir / FINAL_MODEL_FILENAME).exists()
+    with open(out_dir / "batch.log") as batch_fh:
+        batch_fh.readline()
+        iters = [int(line.split("\t")[0]) for line in batch_fh]
+    assert len(iters) > 0
+    assert len(iters) % num_epochs == 0
+    assert iters == list(range(len(iters)))
+
+
 @pytest.mark.smoke
 def test_help():
     check_call(["remora", "-h"])
@@ -98,6 +112,133 @@ def test_train(model_path, tmpdir_factory, chunks, train_cli_args):
     return out_dir
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "precision,device_args",
+    [
+        ("bf16", []),
+        # fp16 uses loss scaling which requires a CUDA device
+        pytest.param(
+            "fp16",
+            ["--device", "0"],
+            marks=pytest.mark.skipif(
+                not torch.cuda.is_available(), reason="CUDA not available"
+            ),
+        ),
+    ],
+)
+def test_train_mixed_precision(
+    precision,
+    device_args,
+    fw_model_path,
+    tmpdir_factory,
+    chunks,
+    train_cli_args,
+):
+    """Run `model train` on the command line with mixed precision."""
+    out_dir = tmpdir_factory.mktemp("remora_tests") / "train_mixed_precision"
+    check_call(
+        [
+            "remora",
+            "model",
+            "train",
+            str(chunks),
+            "--output-path",
+            str(out_dir),
+            "--model",
+            fw_model_path,
+            "--mixed-precision",
+            precision,
+            *device_args,
+            *train_cli_args,
+        ],
+    )
+    check_train_outputs(out_dir, 3)
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(
+    not hasattr(torch, "compile"), reason="torch.compile not available"
+)
+def test_train_compile_model(
+    fw_model_path, tmpdir_factory, chunks, train_cli_args
+):
+    """Run `model train` on the command line with a compiled model."""
+    # torch.compile may be present but unusable (e.g. unsupported python
+    # version or no C++ compiler for the CPU backend)
+    try:
+        torch.compile(lambda x: x + 1)(torch.zeros(1))
+    except Exception as err:
+        pytest.skip(f"torch.compile not functional: {err}")
+    out_dir = tmpdir_factory.mktemp("remora_tests") / "train_compile_model"
+    check_call(
+        [
+            "remora",
+            "model",
+            "train",
+            str(chunks),
+            "--output-path",
+            str(out_dir),
+            "--model",
+            fw_model_path,
+            "--compile-model",
+            *train_cli_args,
+        ],
+    )
+    check_train_outputs(out_dir, 3)
+
+
+@pytest.mark.unit
+def test_train_accum_steps(
+    fw_model_path, tmpdir_factory, chunks, train_cli_args
+):
+    """Run `model train` on the command line with gradient accumulation."""
+    out_dir = tmpdir_factory.mktemp("remora_tests") / "train_accum_steps"
+    check_call(
+        [
+            "remora",
+            "model",
+            "train",
+            str(chunks),
+            "--output-path",
+            str(out_dir),
+            "--model",
+            fw_model_path,
+            "--accum-steps",
+            "3",
+            *train_cli_args,
+        ],
+    )
+    check_train_outputs(out_dir, 3)
+
+
+@pytest.mark.unit
+def test_train_skip_initial_validation(
+    fw_model_path, tmpdir_factory, chunks, train_cli_args
+):
+    """Run `model train` on the command line for a single epoch without the
+    initial validation pass.
+    """
+    out_dir = tmpdir_factory.mktemp("remora_tests") / "train_skip_init_val"
+    check_call(
+        [
+            "remora",
+            "model",
+            "train",
+            str(chunks),
+            "--output-path",
+            str(out_dir),
+            "--model",
+            fw_model_path,
+            "--skip-initial-validation",
+            *train_cli_args,
+            "--epochs",
+            "1",
+        ],
+    )
+    assert (out_dir / FINAL_MODEL_FILENAME).exists()
+
+
 @pytest.mark.unit
 def test_mod_infer(tmpdir_factory, can_pod5, can_mappings, fw_mod_model_dir):
     out_dir = tmpdir_factory.mktemp("remora_tests")